@@ -42,7 +42,11 @@ from .core.validators import (
 )
 
 # Insurance-specific
-from .insurance.claim_notes_analyzer import ClaimNotesAnalyzer, analyze_claim_note
+from .insurance.claim_notes_analyzer import (
+    ClaimNotesAnalyzer,
+    analyze_claim_note,
+    analyze_claim_notes_batch,
+)
 from .utils.long_text_processor import (
     LongTextProcessor,
     analyze_claim_notes,
@@ -93,7 +97,7 @@ __all__ = [
     "validate_entity_type", "validate_pattern_definition",
     "check_pattern_against_examples", "test_pattern_against_examples",
     # Insurance
-    "ClaimNotesAnalyzer", "analyze_claim_note",
+    "ClaimNotesAnalyzer", "analyze_claim_note", "analyze_claim_notes_batch",
     # Text processing
     "LongTextProcessor", "segment_long_text", "extract_pii_rich_segments",
     "analyze_claim_notes",
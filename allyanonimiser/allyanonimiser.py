@@ -626,9 +626,13 @@ class Allyanonimiser:
                 self.add_pattern(pdef)
         return count
 
-    def save_patterns(self, filepath: str) -> str:
-        """Save all registered patterns to a JSON file."""
-        return self.pattern_registry.save_patterns(filepath)
+    def save_patterns(self, filepath: str, pretty: bool = False) -> str:
+        """Save all registered patterns to a JSON file.
+
+        Written compactly (one definition per line) unless *pretty* is set,
+        which indents the file for human review.
+        """
+        return self.pattern_registry.save_patterns(filepath, pretty=pretty)
 
     # ------------------------------------------------------------------
     # spaCy status
@@ -18,6 +18,7 @@ from .false_positives import (
     PERSON_TRAILING_STOP_WORDS,
     STREET_SUFFIXES,
 )
+from .literal_prefilter import may_match, required_literals
 from .recognizer_result import RecognizerResult
 
 logger = logging.getLogger(__name__)
@@ -317,17 +318,19 @@ class EnhancedAnalyzer:
 
             self._cache_misses += 1
 
-        # Check if we have cached pattern results
+        # Check if we have cached pattern results. Only the active entity
+        # types are scanned, so they are part of the key.
         pattern_results = []
-        if self.enable_caching and text in self._pattern_result_cache:
-            pattern_results = self._pattern_result_cache[text].copy()
+        pattern_cache_key = (text, frozenset(active_entity_types))
+        if self.enable_caching and pattern_cache_key in self._pattern_result_cache:
+            pattern_results = self._pattern_result_cache[pattern_cache_key].copy()
         else:
             # Get results from pattern-based detection
-            pattern_results = self._analyze_with_patterns(text)
+            pattern_results = self._analyze_with_patterns(text, active_entity_types)
             # Cache pattern results if caching is enabled
             if self.enable_caching:
                 self._evict_oldest(self._pattern_result_cache, self.max_cache_size)
-                self._pattern_result_cache[text] = pattern_results.copy()
+                self._pattern_result_cache[pattern_cache_key] = pattern_results.copy()
 
         # Check if we have cached spaCy results
         spacy_results = []
@@ -569,12 +572,15 @@ class EnhancedAnalyzer:
 
         return explanation
 
-    def _analyze_with_patterns(self, text):
+    def _analyze_with_patterns(self, text, entity_types=None):
         """
         Analyze text using pattern-based detection.
 
         Args:
             text: The text to analyze
+            entity_types: Optional set of entity types to scan for; patterns
+                of other types are skipped (and never compiled). All types
+                are scanned when empty or None.
 
         Returns:
             List of RecognizerResult objects
@@ -586,6 +592,8 @@ class EnhancedAnalyzer:
                 continue
 
             entity_type = pattern.entity_type
+            if entity_types and entity_type not in entity_types:
+                continue
 
             # For PERSON entity type, skip pattern-based detection if we're using spaCy
             if entity_type == "PERSON" and self.use_spacy:
@@ -600,11 +608,14 @@ class EnhancedAnalyzer:
 
             for regex_pattern in regexes:
                 try:
-                    finditer = (
-                        regex_pattern.finditer(text)
-                        if isinstance(regex_pattern, re.Pattern)
-                        else re.finditer(regex_pattern, text)
-                    )
+                    if isinstance(regex_pattern, re.Pattern):
+                        # Skip the scan when no literal every match needs
+                        # (e.g. "TFN" or "Tax" for a labelled TFN) is present.
+                        if not may_match(required_literals(regex_pattern), text):
+                            continue
+                        finditer = regex_pattern.finditer(text)
+                    else:
+                        finditer = re.finditer(regex_pattern, text)
                     # Find all matches
                     for match in finditer:
                         # Check if the pattern has capturing groups
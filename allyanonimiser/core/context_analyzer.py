@@ -4,6 +4,34 @@ Context-aware analysis for improving entity detection accuracy.
 
 import re
 
+# Context-before patterns that mark a detection as a likely false positive,
+# compiled once at import rather than rebuilt on every check.
+_FALSE_POSITIVE_PATTERNS = {
+    entity_type: tuple(re.compile(pattern, re.IGNORECASE) for pattern in patterns)
+    for entity_type, patterns in {
+        'DATE': [
+            # NSW 2000 (state + postcode)
+            r'(?:NSW|VIC|QLD|WA|SA|TAS|NT|ACT)\s*$',
+            # Part of phone number
+            r'(?:phone|mobile|contact|ph|tel)[\s:]*$',
+            # Part of Medicare number
+            r'medicare[\s:]*$'
+        ],
+        'NUMBER': [
+            # Just a hash symbol
+            r'#\s*$',
+            # Words containing "quarter", "half", etc.
+            r'(?:quarter|half|third)\s+panel',
+        ],
+        'PERSON': [
+            # Street names
+            r'(?:lives?\s+(?:at|on)|address)[\s:]*\d+\s*$',
+            # Policy/claim numbers
+            r'(?:policy|claim)[\s#:]*$'
+        ]
+    }.items()
+}
+
 
 class ContextAnalyzer:
     """Analyzes context around entities to improve detection accuracy."""
@@ -207,33 +235,9 @@ class ContextAnalyzer:
         context_before, context_after = self.get_context_window(text, start, end, window_size=30)
 
         # Check for common false positive patterns
-        false_positive_patterns = {
-            'DATE': [
-                # NSW 2000 (state + postcode)
-                r'(?:NSW|VIC|QLD|WA|SA|TAS|NT|ACT)\s*$',
-                # Part of phone number
-                r'(?:phone|mobile|contact|ph|tel)[\s:]*$',
-                # Part of Medicare number
-                r'medicare[\s:]*$'
-            ],
-            'NUMBER': [
-                # Just a hash symbol
-                r'#\s*$',
-                # Words containing "quarter", "half", etc.
-                r'(?:quarter|half|third)\s+panel',
-            ],
-            'PERSON': [
-                # Street names
-                r'(?:lives?\s+(?:at|on)|address)[\s:]*\d+\s*$',
-                # Policy/claim numbers
-                r'(?:policy|claim)[\s#:]*$'
-            ]
-        }
-
-        if entity_type in false_positive_patterns:
-            patterns = false_positive_patterns[entity_type]
-            if any(re.search(pattern, context_before, re.IGNORECASE) for pattern in patterns):
-                return True
+        patterns = _FALSE_POSITIVE_PATTERNS.get(entity_type)
+        if patterns and any(pattern.search(context_before) for pattern in patterns):
+            return True
 
         # Additional checks for specific entity types
         if entity_type == 'DATE' and entity_text in ['NSW 2000', 'VIC 3000', 'QLD 4000']:
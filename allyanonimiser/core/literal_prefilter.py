@@ -0,0 +1,88 @@
+"""
+Literal prefilter for skipping regex scans that cannot match.
+
+Many detection patterns contain literal text that every match must include
+(a label such as ``BSB`` or ``TFN|Tax File Number``). Checking for those
+literals with ``str.__contains__`` is much cheaper than running the regex.
+"""
+
+import functools
+import re
+from re import _parser as sre_parse  # pyright: ignore[reportAttributeAccessIssue]
+
+_REPEATS = (sre_parse.MAX_REPEAT, sre_parse.MIN_REPEAT, sre_parse.POSSESSIVE_REPEAT)
+
+
+def _leading_literal(parsed) -> str:
+    """The run of LITERAL nodes a parsed regex sequence starts with."""
+    chars = []
+    for op, av in parsed:
+        if op is not sre_parse.LITERAL:
+            break
+        chars.append(chr(av))
+    return "".join(chars)
+
+
+def _literal_runs(parsed) -> list[tuple[str, ...]]:
+    """Collect literal requirements that every match must satisfy.
+
+    Each requirement is a tuple of alternatives, at least one of which
+    every match contains. Walks a parsed regex sequence: consecutive
+    LITERAL nodes form a single-alternative run; a branch whose
+    alternatives all start with literals (``TFN|Tax File``) becomes one
+    requirement per alternative, prefixed by the run before it; groups and
+    repeats with ``min >= 1`` are descended into; anything else (classes,
+    other branches, optional repeats, assertions, case-insensitive groups)
+    ends the current run without contributing to it.
+    """
+    runs: list[tuple[str, ...]] = []
+    current: list[str] = []
+    for op, av in parsed:
+        if op is sre_parse.LITERAL:
+            current.append(chr(av))
+            continue
+        if op is sre_parse.BRANCH:
+            leads = [_leading_literal(alternative) for alternative in av[1]]
+            if all(leads):
+                prefix = "".join(current)
+                runs.append(tuple(prefix + lead for lead in leads))
+                current = []
+                continue
+        if current:
+            runs.append(("".join(current),))
+            current = []
+        if op is sre_parse.SUBPATTERN:
+            _group, add_flags, _del_flags, sub = av
+            if not add_flags & sre_parse.SRE_FLAG_IGNORECASE:
+                runs.extend(_literal_runs(sub))
+        elif op is sre_parse.ATOMIC_GROUP:
+            runs.extend(_literal_runs(av))
+        elif op in _REPEATS and av[0] >= 1:
+            runs.extend(_literal_runs(av[2]))
+    if current:
+        runs.append(("".join(current),))
+    return runs
+
+
+@functools.lru_cache(maxsize=1024)
+def required_literals(compiled: re.Pattern) -> tuple[str, ...] | None:
+    """Literals at least one of which is present in every match of *compiled*.
+
+    Used as a cheap ``str.__contains__`` prefilter: if none of the literals
+    occurs in the text the regex cannot match, so its scan can be skipped.
+    Picks the requirement whose shortest alternative is longest (then the
+    one with fewest alternatives). Returns None when no such literal is
+    known (including all case-insensitive patterns).
+    """
+    if compiled.flags & re.IGNORECASE or not isinstance(compiled.pattern, str):
+        return None
+    try:
+        runs = _literal_runs(sre_parse.parse(compiled.pattern, compiled.flags))
+    except Exception:  # pragma: no cover - private parser API drift
+        return None
+    return max(runs, key=lambda run: (min(map(len, run)), -len(run)), default=None)
+
+
+def may_match(literals: tuple[str, ...] | None, text: str) -> bool:
+    """Whether *text* contains one of a regex's required *literals*."""
+    return literals is None or any(literal in text for literal in literals)
@@ -2,13 +2,29 @@
 Pattern manager for handling custom PII detection patterns.
 """
 
+import functools
 import logging
+import operator
 import re
+from collections.abc import Callable, Iterable
+from concurrent.futures import ProcessPoolExecutor
 from typing import Any
 
+from .literal_prefilter import may_match, required_literals
+
 logger = logging.getLogger(__name__)
 
 
+@functools.lru_cache(maxsize=4096)
+def _compile(pattern: str) -> re.Pattern:
+    """Compile *pattern*, shared across every definition that uses it.
+
+    ``re``'s own cache holds only 512 entries and is evicted wholesale, so
+    the built-in pattern set plus user patterns can outgrow it.
+    """
+    return re.compile(pattern)
+
+
 class CustomPatternDefinition:
     """
     Class for defining custom PII detection patterns.
@@ -22,6 +38,12 @@ class CustomPatternDefinition:
         language: Language this pattern applies to
         description: Description of what this pattern detects
     """
+    # One instance per registered or loaded pattern; slots keep them small.
+    __slots__ = (
+        'entity_type', 'patterns', 'context', 'name', 'score', 'language',
+        'description', '_compiled', '_compiled_snapshot',
+    )
+
     def __init__(self, **kwargs):
         self.entity_type = kwargs.get('entity_type')
         self.patterns = kwargs.get('patterns', [])
@@ -39,15 +61,16 @@ class CustomPatternDefinition:
 
         Compiled once and cached (recompiled only if ``patterns`` is mutated).
         Invalid regexes are logged once at compile time and skipped, instead
-        of raising ``re.error`` on every analyze() call. Non-string entries
-        (spaCy token patterns) are ignored.
+        of raising ``re.error`` on every analyze() call. Repeated regex
+        strings are compiled (and scanned) once. Non-string entries (spaCy
+        token patterns) are ignored.
         """
         snapshot = tuple(p for p in self.patterns if isinstance(p, str))
         if snapshot != self._compiled_snapshot:
             compiled = []
-            for pat in snapshot:
+            for pat in dict.fromkeys(snapshot):
                 try:
-                    compiled.append(re.compile(pat))
+                    compiled.append(_compile(pat))
                 except re.error as e:
                     logger.warning(
                         "Skipping invalid regex for %s (%s): %s",
@@ -87,6 +110,66 @@ class CustomPatternDefinition:
         """
         return cls(**pattern_dict)
 
+
+def _scan(plan, text: str) -> list[dict[str, Any]]:
+    """Run a scan plan from ``PatternManager._compile_combined`` over *text*."""
+    results = []
+
+    for entity_type, score, compiled, literals in plan:
+        # Skip the scan when no literal every match needs is present.
+        if not may_match(literals, text):
+            continue
+        for match in compiled.finditer(text):
+            # Check if the pattern has capturing groups
+            if match.lastindex and match.lastindex > 0:
+                # Use the first capturing group
+                start = match.start(1)
+                end = match.end(1)
+                matched_text = match.group(1)
+            else:
+                # Use the entire match
+                start = match.start()
+                end = match.end()
+                matched_text = match.group()
+
+            results.append({
+                'entity_type': entity_type,
+                'start': start,
+                'end': end,
+                'text': matched_text,
+                'score': score
+            })
+
+    return results
+
+
+# Scan plan installed in each worker process by _init_scan_worker().
+_worker_plan: tuple = ()
+
+
+def _init_scan_worker(plan) -> None:
+    global _worker_plan
+    _worker_plan = plan
+
+
+def _scan_window(job) -> list[tuple[int, dict[str, Any]]]:
+    """Scan one chunk of ``PatternManager.apply_patterns_parallel`` in a worker.
+
+    Returns ``(plan_index, result)`` pairs for matches starting inside the
+    chunk's core, with offsets translated back to the full text.
+    """
+    window, offset, core_start, core_end = job
+    hits = []
+    for index, entry in enumerate(_worker_plan):
+        for result in _scan((entry,), window):
+            start = result['start'] + offset
+            if core_start <= start < core_end:
+                result['start'] = start
+                result['end'] += offset
+                hits.append((index, result))
+    return hits
+
+
 class PatternManager:
     """
     Manager for handling collections of patterns.
@@ -96,6 +179,8 @@ class PatternManager:
     """
     def __init__(self):
         self.patterns = []
+        # entity-type filter -> (snapshot, plan); see _compile_combined()
+        self._combined: dict[frozenset[str] | None, tuple[tuple, tuple]] = {}
 
     def add_pattern(self, pattern: CustomPatternDefinition) -> None:
         """
@@ -106,6 +191,15 @@ class PatternManager:
         """
         self.patterns.append(pattern)
 
+    def bulk_load(self, patterns: Iterable[CustomPatternDefinition]) -> None:
+        """
+        Add several patterns to the manager in one call.
+
+        Args:
+            patterns: The pattern definitions to add, in order
+        """
+        self.patterns.extend(patterns)
+
     def get_patterns_by_entity_type(self, entity_type: str) -> list[CustomPatternDefinition]:
         """
         Get all patterns for a specific entity type.
@@ -129,43 +223,119 @@ class PatternManager:
         Returns:
             List of match dictionaries with entity_type, start, end, text, and score
         """
-        results = []
-
-        # Filter patterns by entity type if specified
-        patterns_to_apply = self.patterns
-        if entity_types:
-            patterns_to_apply = [p for p in self.patterns if p.entity_type in entity_types]
-
-        # Apply each pattern
-        for pattern_def in patterns_to_apply:
-            entity_type = pattern_def.entity_type
-            score = pattern_def.score
-
-            # compiled_patterns covers the string regexes only; spaCy token
-            # patterns need a spaCy model and are skipped here.
-            for compiled in pattern_def.compiled_patterns:
-                for match in compiled.finditer(text):
-                    # Check if the pattern has capturing groups
-                    if match.lastindex and match.lastindex > 0:
-                        # Use the first capturing group
-                        start = match.start(1)
-                        end = match.end(1)
-                        matched_text = match.group(1)
-                    else:
-                        # Use the entire match
-                        start = match.start()
-                        end = match.end()
-                        matched_text = match.group()
-
-                    results.append({
-                        'entity_type': entity_type,
-                        'start': start,
-                        'end': end,
-                        'text': matched_text,
-                        'score': score
-                    })
-
-        return results
+        return _scan(self._compile_combined(entity_types), text)
+
+    def apply_patterns_parallel(
+        self,
+        text: str,
+        entity_types: list[str] | None = None,
+        n_workers: int | None = None,
+        min_chunk: int = 8192,
+        overlap: int = 1024,
+    ) -> list[dict[str, Any]]:
+        """
+        Apply patterns to a large text, scanning chunks on a process pool.
+
+        The text is cut into at least ``min_chunk``-character chunks, one per
+        worker. Each worker scans its chunk plus ``overlap`` characters on
+        either side (so word boundaries, lookbehinds and matches crossing the
+        cut behave as in a full scan) and keeps only matches starting inside
+        its own chunk. Results equal ``apply_patterns(text, entity_types)``
+        as long as no match is longer than ``overlap``.
+
+        With ``n_workers`` unset (or 1), or for texts shorter than two
+        chunks, this is ``apply_patterns``: the pool's startup cost only pays
+        off on inputs of hundreds of kilobytes.
+
+        Args:
+            text: The text to analyze
+            entity_types: Optional list of entity types to restrict to
+            n_workers: Number of worker processes, or None for in-process
+            min_chunk: Minimum number of characters per chunk
+            overlap: Characters of context scanned past each chunk edge
+
+        Returns:
+            List of match dictionaries, as returned by ``apply_patterns``
+        """
+        plan = self._compile_combined(entity_types)
+        if not n_workers or n_workers <= 1 or len(text) < 2 * min_chunk:
+            return _scan(plan, text)
+
+        chunk = max(min_chunk, -(-len(text) // n_workers))
+        jobs = []
+        for core_start in range(0, len(text), chunk):
+            core_end = min(core_start + chunk, len(text))
+            offset = max(0, core_start - overlap)
+            jobs.append((text[offset:core_end + overlap], offset, core_start, core_end))
+
+        with ProcessPoolExecutor(
+            max_workers=n_workers, initializer=_init_scan_worker, initargs=(plan,)
+        ) as executor:
+            hits = [hit for chunk_hits in executor.map(_scan_window, jobs) for hit in chunk_hits]
+
+        # Chunks come back in text order; a stable sort on the plan index
+        # restores apply_patterns' pattern-by-pattern ordering.
+        hits.sort(key=operator.itemgetter(0))
+        return [result for _, result in hits]
+
+    def compile(
+        self, entity_types: list[str] | None = None
+    ) -> Callable[[str], list[dict[str, Any]]]:
+        """
+        Build a scanner specialised to the current patterns.
+
+        The returned function behaves like ``apply_patterns(text, entity_types)``
+        but binds the flattened scan plan once, skipping the per-call check
+        for pattern changes. It is a snapshot: call ``compile()`` again after
+        adding or editing patterns.
+
+        Args:
+            entity_types: Optional list of entity types to restrict to
+
+        Returns:
+            Function mapping text to a list of match dictionaries
+        """
+        plan = self._compile_combined(entity_types)
+
+        def scan(text: str) -> list[dict[str, Any]]:
+            return _scan(plan, text)
+
+        return scan
+
+    def _compile_combined(
+        self, entity_types: list[str] | None = None
+    ) -> tuple[tuple[str, float, re.Pattern, tuple[str, ...] | None], ...]:
+        """Flatten the patterns selected by *entity_types* into scan order.
+
+        Returns ``(entity_type, score, compiled_regex, required_literals)``
+        tuples, cached per entity-type filter. The cache is keyed on a
+        snapshot of the pattern list and each definition's type, score and
+        compiled regexes, so editing ``self.patterns`` or a definition in
+        place rebuilds the plan.
+
+        The regexes are deliberately not fused into one alternation: a
+        single scan reports only leftmost non-overlapping matches, which
+        would drop overlapping hits from different patterns that
+        ``apply_patterns`` has always returned.
+        """
+        key = frozenset(entity_types) if entity_types else None
+        # compiled_patterns covers the string regexes only; spaCy token
+        # patterns need a spaCy model and are skipped here.
+        snapshot = tuple(
+            (p, p.entity_type, p.score, p.compiled_patterns) for p in self.patterns
+        )
+        cached = self._combined.get(key)
+        if cached is not None and cached[0] == snapshot:
+            return cached[1]
+
+        plan = tuple(
+            (entity_type, score, compiled, required_literals(compiled))
+            for _, entity_type, score, compiled_patterns in snapshot
+            if key is None or entity_type in key
+            for compiled in compiled_patterns
+        )
+        self._combined[key] = (snapshot, plan)
+        return plan
 
     def to_dict_list(self) -> list[dict[str, Any]]:
         """
@@ -188,6 +358,7 @@ class PatternManager:
             New PatternManager instance with loaded patterns
         """
         manager = cls()
-        for pattern_dict in pattern_dicts:
-            manager.add_pattern(CustomPatternDefinition.from_dict(pattern_dict))
+        manager.bulk_load(
+            CustomPatternDefinition.from_dict(pattern_dict) for pattern_dict in pattern_dicts
+        )
         return manager
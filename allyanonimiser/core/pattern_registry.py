@@ -6,10 +6,159 @@ loaded, and shared between analyzer instances.
 """
 
 import json
+import logging
 import os
+import pickle
+import sys
+from collections import Counter, defaultdict
+from collections.abc import Iterable, Iterator
 
 from .pattern_manager import CustomPatternDefinition, PatternManager
 
+logger = logging.getLogger(__name__)
+
+# ijson is optional: when installed, load_patterns parses pattern files
+# incrementally instead of materialising the whole list first.
+IJSON_AVAILABLE = False
+try:
+    import ijson
+
+    IJSON_AVAILABLE = True
+except ImportError:
+    pass
+
+# Write buffer for save_patterns; large enough that a typical registry is
+# flushed in a single write.
+_SAVE_BUFFER_SIZE = 1 << 20
+
+# Shared encoder for the compact save path: json.dump builds a new encoder
+# on every call. Non-ASCII text (e.g. suburb names) is written as-is.
+_ENCODER = json.JSONEncoder(separators=(',', ':'), ensure_ascii=False)
+
+
+def _pickle_cache_path(path: str) -> str:
+    """Path of the pickle sidecar kept next to the JSON file at *path*.
+
+    The whole file name is kept, plus a suffix of our own, so the sidecar
+    for ``foo.json`` can't be mistaken for an unrelated ``foo.pkl``.
+    """
+    return path + ".patterns.pkl"
+
+
+def _source_stamp(path: str) -> tuple[int, int]:
+    """The (mtime_ns, size) a pickle sidecar records for the JSON file it mirrors."""
+    stat = os.stat(path)
+    return stat.st_mtime_ns, stat.st_size
+
+
+def _not_an_array(path: str) -> ValueError:
+    """Error raised when a pattern file's top level is not a JSON array."""
+    return ValueError(f"Pattern file {path} must contain a JSON array of pattern definitions")
+
+
+def _stream_pattern_dicts(file, path: str) -> Iterator:
+    """Yield the items of the top-level JSON array in *file* using ijson."""
+    events = ijson.parse(file, use_float=True)
+    first = next(events, None)
+    if first is None or first[1] != 'start_array':
+        raise _not_an_array(path)
+    yield from ijson.items(events, 'item')
+
+
+def _intern_entity_type(pattern: CustomPatternDefinition) -> str | None:
+    """Intern *pattern*'s entity type in place and return it.
+
+    Definitions loaded from JSON each carry their own copy of strings like
+    "AU_PHONE"; interning shares one object per type and lets bucket
+    lookups short-circuit on identity.
+    """
+    entity_type = pattern.entity_type
+    if type(entity_type) is str:
+        entity_type = pattern.entity_type = sys.intern(entity_type)
+    return entity_type
+
+
+class _PatternBucket(list):
+    """One entity type's definitions, with O(1) identity membership.
+
+    Behaves as a plain list, but every mutation also updates a count of the
+    ids it holds, so ``pattern in bucket`` is a dict lookup rather than a
+    list scan. Direct edits (append, remove, item or slice assignment, ...)
+    keep the counts in step.
+    """
+    __slots__ = ('_ids',)
+
+    def __init__(self, iterable=()):
+        super().__init__(iterable)
+        self._ids = Counter(map(id, self))
+
+    def _recount(self) -> None:
+        self._ids = Counter(map(id, self))
+
+    def _discard(self, item) -> None:
+        key = id(item)
+        self._ids[key] -= 1
+        if not self._ids[key]:
+            del self._ids[key]
+
+    def __contains__(self, item) -> bool:
+        # Definitions compare by identity, so this matches list.__contains__.
+        return id(item) in self._ids
+
+    def append(self, item) -> None:
+        super().append(item)
+        self._ids[id(item)] += 1
+
+    def extend(self, items) -> None:
+        items = list(items)
+        super().extend(items)
+        self._ids.update(map(id, items))
+
+    def insert(self, index, item) -> None:
+        super().insert(index, item)
+        self._ids[id(item)] += 1
+
+    def remove(self, item) -> None:
+        del self[self.index(item)]
+
+    def pop(self, index=-1):
+        item = super().pop(index)
+        self._discard(item)
+        return item
+
+    def clear(self) -> None:
+        super().clear()
+        self._ids.clear()
+
+    def __setitem__(self, index, value) -> None:
+        if isinstance(index, slice):
+            super().__setitem__(index, value)
+            self._recount()
+        else:
+            self._discard(self[index])
+            super().__setitem__(index, value)
+            self._ids[id(value)] += 1
+
+    def __delitem__(self, index) -> None:
+        if isinstance(index, slice):
+            super().__delitem__(index)
+            self._recount()
+        else:
+            self._discard(self[index])
+            super().__delitem__(index)
+
+    def __iadd__(self, items):
+        self.extend(items)
+        return self
+
+    def __imul__(self, n):
+        super().__imul__(n)
+        self._recount()
+        return self
+
+    def __reduce__(self):
+        return (type(self), (list(self),))
+
 
 class PatternRegistry:
     """
@@ -18,30 +167,82 @@ class PatternRegistry:
     This class provides persistent storage for patterns, with methods to save
     and load patterns from disk.
     """
-    def __init__(self, storage_path: str | None = None):
+    def __init__(self, storage_path: str | None = None, pickle_cache: bool = False):
         """
         Initialize a pattern registry.
 
         Args:
             storage_path: Optional path to store pattern files
+            pickle_cache: Whether save_patterns also writes a
+                ``.patterns.pkl`` sidecar that load_patterns prefers while
+                the JSON file still has the mtime and size recorded in it.
+                Only enable this for files you trust: unpickling can run
+                arbitrary code.
         """
-        self.patterns = {}  # Dict of entity_type -> list of pattern definitions
+        # Dict of entity_type -> list of pattern definitions. Buckets are
+        # _PatternBucket lists; plain lists assigned here directly are
+        # converted on the next registration for that type.
+        self.patterns = {}
         self.storage_path = storage_path
+        self.pickle_cache = pickle_cache
 
     def register_pattern(self, pattern: CustomPatternDefinition) -> None:
         """
         Register a pattern with the registry.
 
+        A definition already in its entity type's bucket is not added again;
+        the check is O(1).
+
         Args:
             pattern: Pattern definition to register
         """
-        entity_type = pattern.entity_type
-        if entity_type not in self.patterns:
-            self.patterns[entity_type] = []
+        bucket = self._bucket(_intern_entity_type(pattern))
+        if pattern not in bucket:
+            bucket.append(pattern)
+            # Reading the cached property compiles the regexes now, so
+            # analyzers built from the registry don't pay for it on first use.
+            _ = pattern.compiled_patterns
+
+    def register_many(self, patterns: Iterable[CustomPatternDefinition]) -> int:
+        """
+        Register several patterns with the registry in one pass.
+
+        Equivalent to calling :meth:`register_pattern` for each pattern, but
+        groups them by entity type first so each bucket is looked up once.
 
-        # Add if not already registered
-        if pattern not in self.patterns[entity_type]:
-            self.patterns[entity_type].append(pattern)
+        Args:
+            patterns: Pattern definitions to register
+
+        Returns:
+            Number of patterns processed (including ones already registered)
+        """
+        grouped = defaultdict(list)
+        count = 0
+        for pattern in patterns:
+            grouped[_intern_entity_type(pattern)].append(pattern)
+            count += 1
+
+        for entity_type, group in grouped.items():
+            self._add_to_bucket(entity_type, group)
+        return count
+
+    def _add_to_bucket(self, entity_type: str, patterns) -> None:
+        """Append the not-yet-registered *patterns* to one entity type's bucket."""
+        bucket = self._bucket(entity_type)
+
+        # Add if not already registered, compiling its regexes up front so
+        # analyzers built from the registry don't pay for it on first use.
+        for pattern in patterns:
+            if pattern not in bucket:
+                bucket.append(pattern)
+                _ = pattern.compiled_patterns  # compiles and caches them
+
+    def _bucket(self, entity_type: str | None) -> _PatternBucket:
+        """Return *entity_type*'s bucket, converting a plain list put there directly."""
+        bucket = self.patterns.get(entity_type)
+        if type(bucket) is not _PatternBucket:
+            bucket = self.patterns[entity_type] = _PatternBucket(bucket or ())
+        return bucket
 
     def get_patterns(self, entity_type: str | None = None) -> list[CustomPatternDefinition]:
         """
@@ -56,18 +257,34 @@ class PatternRegistry:
         if entity_type:
             return self.patterns.get(entity_type, [])
         else:
-            # Return all patterns
-            all_patterns = []
+            return list(self.iter_patterns())
+
+    def iter_patterns(self, entity_type: str | None = None) -> Iterator[CustomPatternDefinition]:
+        """
+        Iterate over patterns in the registry without building a list.
+
+        Args:
+            entity_type: Optional entity type to filter by
+
+        Yields:
+            Pattern definitions, grouped by entity type in registration order
+        """
+        if entity_type:
+            yield from self.patterns.get(entity_type, ())
+        else:
             for patterns_list in self.patterns.values():
-                all_patterns.extend(patterns_list)
-            return all_patterns
+                yield from patterns_list
 
-    def save_patterns(self, filepath: str | None = None) -> str:
+    def save_patterns(self, filepath: str | None = None, pretty: bool = False) -> str:
         """
         Save pattern definitions to a JSON file.
 
+        By default each definition is streamed to the file in compact form,
+        one per line, so the full list is never built in memory.
+
         Args:
             filepath: Optional path to save to (defaults to storage_path/patterns.json)
+            pretty: Whether to write the file indented for human reading
 
         Returns:
             Path where patterns were saved
@@ -79,18 +296,34 @@ class PatternRegistry:
 
         # Create containing directory if it doesn't exist
         directory = os.path.dirname(path)
-        if directory and not os.path.exists(directory):
-            os.makedirs(directory)
-
-        # Convert patterns to serializable format
-        pattern_dicts = []
-        for entity_patterns in self.patterns.values():
-            for pattern in entity_patterns:
-                pattern_dicts.append(pattern.to_dict())
-
-        # Save to JSON file
-        with open(path, 'w') as file:
-            json.dump(pattern_dicts, file, indent=2)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+
+        patterns = self.iter_patterns()
+
+        with open(path, 'w', encoding='utf-8', buffering=_SAVE_BUFFER_SIZE) as file:
+            if pretty:
+                json.dump([pattern.to_dict() for pattern in patterns], file, indent=2)
+            else:
+                file.write('[')
+                for i, pattern in enumerate(patterns):
+                    if i:
+                        file.write(',\n')
+                    file.write(_ENCODER.encode(pattern.to_dict()))
+                file.write(']')
+
+        # Stamped with the finished JSON file's mtime and size; any later
+        # change to the JSON file makes the sidecar stale.
+        if self.pickle_cache:
+            with open(_pickle_cache_path(path), 'wb', buffering=_SAVE_BUFFER_SIZE) as file:
+                pickle.dump(
+                    (
+                        _source_stamp(path),
+                        [pattern.to_dict() for pattern in self.iter_patterns()],
+                    ),
+                    file,
+                    protocol=pickle.HIGHEST_PROTOCOL,
+                )
 
         return path
 
@@ -98,6 +331,13 @@ class PatternRegistry:
         """
         Load pattern definitions from a JSON file.
 
+        With ``pickle_cache`` enabled, a ``.patterns.pkl`` sidecar written by
+        save_patterns is used instead while the JSON file is unchanged since.
+        Otherwise uses ``ijson`` to stream the file when it is installed,
+        falling back to ``json.load``. Either way a malformed file raises
+        ``json.JSONDecodeError`` and a file whose top level is not an array
+        raises ``ValueError``.
+
         Args:
             filepath: Optional path to load from (defaults to storage_path/patterns.json)
 
@@ -112,18 +352,70 @@ class PatternRegistry:
         if not os.path.exists(path):
             return 0
 
-        # Load from JSON file
-        with open(path) as file:
+        if self.pickle_cache:
+            pattern_dicts = self._load_pickle_cache(path)
+            if pattern_dicts is not None:
+                return self.register_many(
+                    CustomPatternDefinition.from_dict(pattern_dict)
+                    for pattern_dict in pattern_dicts
+                )
+
+        with open(path, 'rb') as file:
+            # Stream items when ijson is available so only one pattern dict
+            # is alive at a time; otherwise load the whole list.
+            if IJSON_AVAILABLE:
+                try:
+                    return self.register_many(
+                        CustomPatternDefinition.from_dict(pattern_dict)
+                        for pattern_dict in _stream_pattern_dicts(file, path)
+                    )
+                except ijson.JSONError:
+                    # Malformed file. register_many only adds once the input
+                    # is exhausted, so nothing was registered; re-parse with
+                    # json below so callers get the same json.JSONDecodeError
+                    # with or without ijson installed.
+                    file.seek(0)
+
             pattern_dicts = json.load(file)
+            if not isinstance(pattern_dicts, list):
+                raise _not_an_array(path)
 
-        # Register each pattern
-        count = 0
-        for pattern_dict in pattern_dicts:
-            pattern = CustomPatternDefinition.from_dict(pattern_dict)
-            self.register_pattern(pattern)
-            count += 1
+            return self.register_many(
+                CustomPatternDefinition.from_dict(pattern_dict)
+                for pattern_dict in pattern_dicts
+            )
 
-        return count
+    def _load_pickle_cache(self, path: str) -> list | None:
+        """Return the pattern dicts from *path*'s pickle sidecar if it is current.
+
+        The sidecar is current only while the JSON file still has the mtime
+        and size recorded in it. Any sidecar that is missing, stale,
+        unreadable or malformed is treated as a cache miss, so load_patterns
+        falls back to the JSON.
+        """
+        cache_path = _pickle_cache_path(path)
+        try:
+            with open(cache_path, 'rb', buffering=_SAVE_BUFFER_SIZE) as file:
+                cached = pickle.load(file)
+        except FileNotFoundError:
+            return None
+        except Exception as e:  # unpickling can raise almost anything
+            logger.warning("Ignoring unreadable pattern cache %s: %s", cache_path, e)
+            return None
+
+        if not (
+            isinstance(cached, tuple)
+            and len(cached) == 2
+            and isinstance(cached[1], list)
+            and all(isinstance(pattern_dict, dict) for pattern_dict in cached[1])
+        ):
+            logger.warning("Ignoring malformed pattern cache %s", cache_path)
+            return None
+
+        stamp, pattern_dicts = cached
+        if stamp != _source_stamp(path):
+            return None
+        return pattern_dicts
 
     def clear(self) -> None:
         """Clear all patterns from the registry."""
@@ -139,11 +431,7 @@ class PatternRegistry:
         Returns:
             Number of patterns imported
         """
-        count = 0
-        for pattern in pattern_manager.patterns:
-            self.register_pattern(pattern)
-            count += 1
-        return count
+        return self.register_many(pattern_manager.patterns)
 
     def export_to_manager(self) -> PatternManager:
         """
@@ -153,6 +441,5 @@ class PatternRegistry:
             PatternManager instance with all registered patterns
         """
         manager = PatternManager()
-        for pattern in self.get_patterns():
-            manager.add_pattern(pattern)
+        manager.bulk_load(self.iter_patterns())
         return manager
@@ -2,12 +2,21 @@
 Specialized analyzer for insurance claim notes - stub for testing.
 """
 
+import threading
+from concurrent.futures import ProcessPoolExecutor
+
 from ..core.analyzer import EnhancedAnalyzer
 from ..utils.long_text_processor import LongTextProcessor
 
 # Don't import create_au_insurance_analyzer from top-level module
 # Instead, create a local analyzer instance
 
+# Default analyzer reused by analyze_claim_note(). EnhancedAnalyzer instances
+# are not thread-safe, so each thread lazily builds its own. Its result caches
+# are cleared after every call (see _analyze_with_default) so claim-note text
+# and the PII found in it are not retained between calls.
+_default_analyzer = threading.local()
+
 class ClaimNotesAnalyzer:
     """
     Specialized analyzer for extracting structured information from claim notes.
@@ -16,21 +25,98 @@ class ClaimNotesAnalyzer:
         self.analyzer = analyzer or EnhancedAnalyzer()
         self.processor = LongTextProcessor()
 
+    def analyze(self, note_text):
+        """Analyze a claim note for PII entities and structured information."""
+        return self._build_result(note_text, self.analyzer.analyze(note_text))
+
+    def analyze_batch(self, note_texts):
+        """Analyze several claim notes at once.
+
+        Goes through :meth:`EnhancedAnalyzer.analyze_batch`, so spaCy NER
+        runs over the whole batch in one ``nlp.pipe()`` call. Results match
+        calling :meth:`analyze` on each note.
+        """
+        note_texts = list(note_texts)
+        return [
+            self._build_result(note_text, entities)
+            for note_text, entities in zip(
+                note_texts, self.analyzer.analyze_batch(note_texts)
+            )
+        ]
+
+    @staticmethod
+    def _build_result(note_text, entities):
+        # Convert entities to a dictionary format
+        pii_entities = [
+            {"entity_type": entity.entity_type, "text": entity.text, "score": entity.score}
+            for entity in entities
+        ]
+
+        return {
+            "text": note_text,
+            "pii_entities": pii_entities,
+            "incident_description": note_text[:100] + "..." if len(note_text) > 100 else note_text
+        }
+
+def _get_default_analyzer():
+    """Return this thread's shared ClaimNotesAnalyzer, creating it on first use."""
+    analyzer = getattr(_default_analyzer, "instance", None)
+    if analyzer is None:
+        analyzer = _default_analyzer.instance = ClaimNotesAnalyzer()
+    return analyzer
+
+def _analyze_with_default(note_texts):
+    """Run *note_texts* through this thread's default analyzer as one batch.
+
+    The analyzer's caches are cleared afterwards, so nothing from the notes
+    outlives the call.
+    """
+    analyzer = _get_default_analyzer()
+    try:
+        return analyzer.analyze_batch(note_texts)
+    finally:
+        analyzer.analyzer.clear_cache()
+
 def analyze_claim_note(note_text):
-    """Analyze a claim note for PII entities and structured information."""
-    analyzer = ClaimNotesAnalyzer()
+    """Analyze a claim note for PII entities and structured information.
 
-    # Analyze the text for entities
-    entities = analyzer.analyzer.analyze(note_text)
+    Reuses a per-thread default :class:`ClaimNotesAnalyzer` instead of
+    building (and re-warming) a new analyzer on every call. No note text
+    is kept once the call returns.
+    """
+    return _analyze_with_default([note_text])[0]
 
-    # Convert entities to a dictionary format
-    pii_entities = [
-        {"entity_type": entity.entity_type, "text": entity.text, "score": entity.score}
-        for entity in entities
-    ]
 
-    return {
-        "text": note_text,
-        "pii_entities": pii_entities,
-        "incident_description": note_text[:100] + "..." if len(note_text) > 100 else note_text
-    }
+def analyze_claim_notes_batch(note_texts, n_workers=None):
+    """Analyze a corpus of claim notes.
+
+    With ``n_workers`` unset (or 1) the notes go through the default
+    analyzer's :meth:`ClaimNotesAnalyzer.analyze_batch` in this process.
+    With ``n_workers > 1`` they are split into chunks that are spread over
+    a process pool, so the Python-bound regex and filtering work runs on
+    several cores; each worker builds its own default analyzer (and loads
+    spaCy) once and runs each chunk through ``analyze_batch``, keeping
+    spaCy's ``nlp.pipe()`` batching. The pool's startup cost only pays off
+    for large corpora (hundreds of notes).
+
+    Args:
+        note_texts: Iterable of claim note strings
+        n_workers: Number of worker processes, or None for in-process
+
+    Returns:
+        List of results in input order, as returned by analyze_claim_note
+    """
+    note_texts = list(note_texts)
+    if not n_workers or n_workers <= 1 or len(note_texts) < 2:
+        return _analyze_with_default(note_texts)
+
+    chunksize = max(1, len(note_texts) // (n_workers * 4))
+    chunks = [
+        note_texts[i:i + chunksize] for i in range(0, len(note_texts), chunksize)
+    ]
+    with ProcessPoolExecutor(max_workers=n_workers) as executor:
+        return [
+            result
+            for chunk_results in executor.map(_analyze_with_default, chunks)
+            for result in chunk_results
+        ]
@@ -6,6 +6,7 @@ Provides direct CSV file handling, auto-detection, and streaming capabilities.
 import json
 import logging
 import os
+from collections import Counter
 from datetime import datetime
 from pathlib import Path
 from typing import Any
@@ -112,6 +113,7 @@ class CSVProcessor(BaseProcessor):
                 raise ValueError(f"Columns not found in CSV: {missing_columns}")
 
             # Process each column
+            entities_found = Counter()
             for column in columns_to_anonymize:
                 logger.info(f"Processing column: {column}")
 
@@ -123,8 +125,9 @@ class CSVProcessor(BaseProcessor):
 
                 entity_lists = df[column].apply(_count_entities)
                 for entity_types in entity_lists:
-                    for et in entity_types:
-                        stats["entities_found"][et] = stats["entities_found"].get(et, 0) + 1
+                    entities_found.update(entity_types)
+                # Record per column so counts survive a later column failing.
+                stats["entities_found"] = dict(entities_found)
 
                 if operation == "anonymize":
                     def _anonymize(text):
@@ -0,0 +1,36 @@
+"""Helpers for the built-in pattern definition tables.
+
+Each pattern module builds its definitions once at import with
+:func:`freeze_definitions` and hands callers fresh, mutable copies via
+:func:`copy_definitions`.
+"""
+
+import sys
+
+
+def freeze_definitions(definitions):
+    """Return *definitions* as a tuple with tuple ``patterns``/``context``.
+
+    Context keywords are interned so every definition (and every copy)
+    shares one string object per keyword.
+    """
+    return tuple(
+        {
+            **definition,
+            "patterns": tuple(definition["patterns"]),
+            "context": tuple(sys.intern(word) for word in definition["context"]),
+        }
+        for definition in definitions
+    )
+
+
+def copy_definitions(definitions, entity_types=None):
+    """Return a list of mutable copies of frozen *definitions*.
+
+    If *entity_types* is given, only definitions of those types are copied.
+    """
+    return [
+        {**definition, "patterns": list(definition["patterns"]), "context": list(definition["context"])}
+        for definition in definitions
+        if entity_types is None or definition["entity_type"] in entity_types
+    ]
@@ -9,7 +9,11 @@ pattern differed by ``\\s+`` vs ``\\s*``); any change to an identifier's
 shape must now be made exactly once, here.
 """
 
-EMAIL_ADDRESS_PATTERN = r"\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Z|a-z]{2,}\b"
+# The local part is capped at the RFC 5321 limit of 64 characters. The
+# lookbehind stops a match starting partway into a longer local part, so an
+# over-long address matches whole or not at all instead of leaving its
+# prefix unredacted.
+EMAIL_ADDRESS_PATTERN = r"(?<![\w.%+-])[A-Za-z0-9._%+-]{1,64}@[A-Za-z0-9.-]+\.[A-Z|a-z]{2,}\b"
 
 AU_PHONE_PATTERNS: list[str] = [
     r"\b(?:\+61|0)4\d{2}[\s-]?\d{3}[\s-]?\d{3}\b",  # Mobile with flexible spacing
@@ -45,3 +49,12 @@ AU_PASSPORT_LABELLED = rf"(?:Passport|Passport\s+Number){_FILLER}([A-Z][0-9]{{7}
 AU_CENTRELINK_CRN_LABELLED = (
     rf"(?:CRN|Centrelink\s+Reference\s+Number){_FILLER}(\d{{3}}\s*\d{{3}}\s*\d{{3}}[A-Z]?)\b"
 )
+
+# Australian state/territory codes and street-type suffixes, shared by the
+# AU_ADDRESS variants and LOCATION so the lists can't drift apart.
+AU_STATE = r"(?:NSW|VIC|QLD|WA|SA|TAS|NT|ACT)"
+AU_STREET_TYPE = (
+    r"(?:Street|St\.?|Road|Rd\.?|Avenue|Ave\.?|Drive|Dr\.?|Lane|Ln\.?|Place|Pl\.?"
+    r"|Court|Ct\.?|Crescent|Cres\.?|Cr\.?|Boulevard|Blvd\.?|Parade|Pde\.?"
+    r"|Highway|Hwy\.?|Close|Cl\.?|Terrace|Tce\.?|Way)"
+)
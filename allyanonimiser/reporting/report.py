@@ -11,6 +11,10 @@ import pandas as pd
 
 logger = logging.getLogger(__name__)
 
+# Reused encoder and write buffer size for streamed JSON report export.
+_PRETTY_JSON_ENCODER = json.JSONEncoder(indent=2)
+_JSON_WRITE_BUFFER = 1 << 20
+
 try:
     import matplotlib.pyplot as plt
     HAS_VISUALIZATION = True
@@ -207,13 +211,16 @@ class AnonymizationReport:
         summary["document_reports"] = self.document_reports
         return summary
 
-    def export_report(self, filepath: str, format: str = "json") -> str:
+    def export_report(self, filepath: str, format: str = "json", pretty: bool = True) -> str:
         """
         Export the report to a file.
 
         Args:
             filepath: Path to save the report
             format: Format for the report (json, csv, html)
+            pretty: Indent JSON output for readability. Pass False for compact
+                JSON, which is smaller and much faster to encode for large
+                reports. Ignored for other formats.
 
         Returns:
             Path to the saved report file
@@ -224,8 +231,17 @@ class AnonymizationReport:
         os.makedirs(os.path.dirname(filepath), exist_ok=True)
 
         if format.lower() == "json":
-            with open(filepath, 'w') as f:
-                json.dump(self.get_detailed_report(), f, indent=2)
+            report = self.get_detailed_report()
+            with open(filepath, 'w', buffering=_JSON_WRITE_BUFFER) as f:
+                if pretty:
+                    # Indented output always goes through json's pure-Python
+                    # encoder, so stream its chunks into a large buffer rather
+                    # than joining the whole document in memory first.
+                    for chunk in _PRETTY_JSON_ENCODER.iterencode(report):
+                        f.write(chunk)
+                else:
+                    # Compact output can use the one-shot C encoder.
+                    f.write(json.dumps(report, separators=(",", ":")))
             return filepath
 
         elif format.lower() == "csv":
@@ -3,6 +3,46 @@ Long text processor for breaking down and analyzing text.
 """
 import re
 
+_PARAGRAPH_BREAK = re.compile(r'\n\s*\n')
+
+# PII heuristics used to rank segments, compiled once at import.
+_PII_PATTERNS: dict[str, re.Pattern] = {
+    'PHONE': re.compile(r'\b(?:\+?61|0)[2378]\s*\d{4}\s*\d{4}\b'),
+    'EMAIL': re.compile(r'\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Z|a-z]{2,}\b'),
+    'DATE': re.compile(r'\b\d{1,2}[/.-]\d{1,2}[/.-]\d{2,4}\b'),
+    'ADDRESS': re.compile(r'\b\d+\s+[A-Za-z]+\s+(?:Street|St|Road|Rd|Avenue|Ave|Drive|Dr)\b'),
+    'POSTCODE': re.compile(r'\b\d{4}\b'),
+    'NAME': re.compile(r'\b(?:Mr|Ms|Mrs|Dr|Professor|Prof)\.\s+[A-Z][a-z]+\b'),
+    'TFN': re.compile(r'\b\d{3}\s*\d{3}\s*\d{3}\b'),
+    'MEDICARE': re.compile(r'\b\d{4}\s*\d{5}\s*\d{1}\b'),
+}
+# Fallback keywords for segments with no pattern hits (plain substring scan).
+_PII_CONTEXT_KEYWORDS = ('customer', 'patient', 'client', 'insured', 'member', 'policy', 'claim')
+
+# Claim-note section headers, fused into one named-group alternation so each
+# segment is scanned once. The header phrases share no text, so one match
+# can never hide another section's header.
+_SECTION_HEADERS: dict[str, str] = {
+    'claim': r'Claim\s+Details|Incident\s+Details|Accident\s+Details',
+    'customer': r'Customer\s+Details|Insured\s+Details|Policyholder\s+Details',
+    'vehicle': r'Vehicle\s+Details|Car\s+Details|Vehicle\s+Information',
+    'assessment': r'Assessment|Evaluation|Inspection',
+    'actions': r'Actions|Next\s+Steps|Follow-up',
+}
+_SECTIONS = re.compile(
+    '|'.join(f'(?P<{name}>{pattern})' for name, pattern in _SECTION_HEADERS.items()),
+    re.IGNORECASE,
+)
+
+# Claim-note metadata fields.
+_CLAIM_NUMBER = re.compile(r'Claim\s+(?:Number|#|Reference):\s+([A-Z0-9-]+)', re.IGNORECASE)
+_POLICY_NUMBER = re.compile(r'Policy\s+(?:Number|#):\s+([A-Z0-9-]+)', re.IGNORECASE)
+_CUSTOMER_NAME = re.compile(r'(?:Customer|Insured|Policyholder):\s+([A-Za-z\s]+)', re.IGNORECASE)
+_INCIDENT_DATE = re.compile(
+    r'(?:occurred|happened|date)(?:\s+on)?\s+(\d{1,2}[/.-]\d{1,2}[/.-]\d{2,4})', re.IGNORECASE
+)
+_SECTION_HEADER = re.compile(r'^.*?(?:Details|Information):\s*', re.IGNORECASE | re.DOTALL)
+
 
 class LongTextProcessor:
     """
@@ -36,7 +76,7 @@ def segment_long_text(text, max_segment_length=300, overlap=50):
         return [{'text': text, 'start': 0, 'end': len(text)}]
 
     # Split text into paragraphs
-    paragraphs = re.split(r'\n\s*\n', text)
+    paragraphs = _PARAGRAPH_BREAK.split(text)
 
     segments = []
     current_segment = ""
@@ -92,23 +132,11 @@ def extract_pii_rich_segments(text, analyzer=None):
 
         # Simple heuristic for PII likelihood
         pii_likelihood = 0.0
-
-        # Check for common PII patterns
-        pii_patterns = {
-            'PHONE': r'\b(?:\+?61|0)[2378]\s*\d{4}\s*\d{4}\b',
-            'EMAIL': r'\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Z|a-z]{2,}\b',
-            'DATE': r'\b\d{1,2}[/.-]\d{1,2}[/.-]\d{2,4}\b',
-            'ADDRESS': r'\b\d+\s+[A-Za-z]+\s+(?:Street|St|Road|Rd|Avenue|Ave|Drive|Dr)\b',
-            'POSTCODE': r'\b\d{4}\b',
-            'NAME': r'\b(?:Mr|Ms|Mrs|Dr|Professor|Prof)\.\s+[A-Z][a-z]+\b',
-            'TFN': r'\b\d{3}\s*\d{3}\s*\d{3}\b',
-            'MEDICARE': r'\b\d{4}\s*\d{5}\s*\d{1}\b'
-        }
-
         pii_scores = {}
 
-        for pii_type, pattern in pii_patterns.items():
-            matches = re.findall(pattern, segment_text)
+        # Check for common PII patterns
+        for pii_type, pattern in _PII_PATTERNS.items():
+            matches = pattern.findall(segment_text)
             if matches:
                 score = min(1.0, len(matches) * 0.2)
                 pii_scores[pii_type] = score
@@ -116,12 +144,10 @@ def extract_pii_rich_segments(text, analyzer=None):
 
         # If no patterns matched but contains words like "customer" or "patient"
         if pii_likelihood == 0.0:
-            pii_keywords = ['customer', 'patient', 'client', 'insured', 'member', 'policy', 'claim']
-            for keyword in pii_keywords:
-                if keyword in segment_text.lower():
-                    pii_likelihood = 0.3
-                    pii_scores['CONTEXT'] = 0.3
-                    break
+            lowered = segment_text.lower()
+            if any(keyword in lowered for keyword in _PII_CONTEXT_KEYWORDS):
+                pii_likelihood = 0.3
+                pii_scores['CONTEXT'] = 0.3
 
         segment['pii_likelihood'] = pii_likelihood
         segment['pii_scores'] = pii_scores
@@ -146,20 +172,12 @@ def analyze_claim_notes(text, analyzer=None):
     segments = extract_pii_rich_segments(text, analyzer)
 
     # Identify main sections
-    section_patterns = {
-        'claim': r'(?:Claim\s+Details|Incident\s+Details|Accident\s+Details)',
-        'customer': r'(?:Customer\s+Details|Insured\s+Details|Policyholder\s+Details)',
-        'vehicle': r'(?:Vehicle\s+Details|Car\s+Details|Vehicle\s+Information)',
-        'assessment': r'(?:Assessment|Evaluation|Inspection)',
-        'actions': r'(?:Actions|Next\s+Steps|Follow-up)'
-    }
-
     section_segments = {}
     for segment in segments:
-        segment_text = segment['text']
+        found = {match.lastgroup for match in _SECTIONS.finditer(segment['text'])}
 
-        for section_type, pattern in section_patterns.items():
-            if re.search(pattern, segment_text, re.IGNORECASE):
+        for section_type in _SECTION_HEADERS:
+            if section_type in found:
                 if section_type not in section_segments:
                     section_segments[section_type] = []
                 section_segments[section_type].append(segment)
@@ -172,22 +190,22 @@ def analyze_claim_notes(text, analyzer=None):
     }
 
     # Extract claim number
-    claim_match = re.search(r'Claim\s+(?:Number|#|Reference):\s+([A-Z0-9-]+)', text, re.IGNORECASE)
+    claim_match = _CLAIM_NUMBER.search(text)
     if claim_match:
         result['metadata']['claim_number'] = claim_match.group(1)
 
     # Extract policy number
-    policy_match = re.search(r'Policy\s+(?:Number|#):\s+([A-Z0-9-]+)', text, re.IGNORECASE)
+    policy_match = _POLICY_NUMBER.search(text)
     if policy_match:
         result['metadata']['policy_number'] = policy_match.group(1)
 
     # Extract customer name
-    customer_match = re.search(r'(?:Customer|Insured|Policyholder):\s+([A-Za-z\s]+)', text, re.IGNORECASE)
+    customer_match = _CUSTOMER_NAME.search(text)
     if customer_match:
         result['metadata']['customer_name'] = customer_match.group(1)
 
     # Extract incident date
-    date_match = re.search(r'(?:occurred|happened|date)(?:\s+on)?\s+(\d{1,2}[/.-]\d{1,2}[/.-]\d{2,4})', text, re.IGNORECASE)
+    date_match = _INCIDENT_DATE.search(text)
     if date_match:
         result['metadata']['incident_date'] = date_match.group(1)
 
@@ -195,7 +213,7 @@ def analyze_claim_notes(text, analyzer=None):
     if 'claim' in section_segments and section_segments['claim']:
         incident_text = section_segments['claim'][0]['text']
         # Remove the header
-        incident_text = re.sub(r'^.*?(?:Details|Information):\s*', '', incident_text, flags=re.IGNORECASE|re.DOTALL)
+        incident_text = _SECTION_HEADER.sub('', incident_text)
         result['incident_description'] = incident_text.strip()
 
     return result
@@ -10,9 +10,13 @@ functionality, including:
 - Hypothesis-based property tests
 """
 
+import json
 import os
+import pickle
 import re
+import sys
 
+import pytest
 from hypothesis import given
 from hypothesis import strategies as st
 
@@ -22,6 +26,7 @@ from allyanonimiser import (
     PatternRegistry,
     create_allyanonimiser,
 )
+from allyanonimiser.core.literal_prefilter import required_literals
 from allyanonimiser.core.validators import (
     test_pattern_against_examples as check_pattern_against_examples,
 )
@@ -139,6 +144,15 @@ class TestCustomPatternDefinition:
         assert roundtrip.language == original.language
         assert roundtrip.description == original.description
 
+    def test_pickle_roundtrip_with_slots(self):
+        """Slotted definitions carry no __dict__ and still pickle (process pools)."""
+        original = CustomPatternDefinition(entity_type="TEST_ENTITY", patterns=["TEST-\\d{5}"])
+        assert not hasattr(original, "__dict__")
+
+        restored = pickle.loads(pickle.dumps(original))
+        assert restored.to_dict() == original.to_dict()
+        assert restored.compiled_patterns[0].pattern == "TEST-\\d{5}"
+
 
 class TestPatternManager:
     """Tests for the PatternManager class."""
@@ -169,6 +183,12 @@ class TestPatternManager:
         assert manager.patterns[0] == pattern1
         assert manager.patterns[1] == pattern2
 
+        # bulk_load appends in order, accepting any iterable
+        bulk = PatternManager()
+        bulk.add_pattern(pattern1)
+        bulk.bulk_load(p for p in (pattern2, pattern1))
+        assert bulk.patterns == [pattern1, pattern2, pattern1]
+
     def test_get_patterns_by_entity_type(self):
         """Test getting patterns by entity type."""
         manager = PatternManager()
@@ -229,6 +249,95 @@ class TestPatternManager:
         assert results[0]["entity_type"] == "ORDER_ID"
         assert results[0]["text"] == "ORD-123456"
 
+    def test_apply_patterns_keeps_overlapping_matches(self):
+        """Overlapping matches from different patterns are all returned."""
+        manager = PatternManager()
+        manager.add_pattern(CustomPatternDefinition(entity_type="ORDER_ID", patterns=["ORD-\\d{6}"]))
+        manager.add_pattern(CustomPatternDefinition(entity_type="NUMBER", patterns=["\\d{6}"]))
+
+        results = manager.apply_patterns("Order ORD-123456 shipped.")
+
+        assert {r["entity_type"] for r in results} == {"ORDER_ID", "NUMBER"}
+
+    def test_apply_patterns_sees_later_changes(self):
+        """Cached scan plans pick up patterns added or edited after a call."""
+        manager = PatternManager()
+        pattern = CustomPatternDefinition(entity_type="ORDER_ID", patterns=["ORD-\\d{6}"])
+        manager.add_pattern(pattern)
+        text = "Order ORD-123456, invoice INV-654321."
+        assert len(manager.apply_patterns(text)) == 1
+
+        manager.patterns.append(
+            CustomPatternDefinition(entity_type="INVOICE_ID", patterns=["INV-\\d{6}"])
+        )
+        assert len(manager.apply_patterns(text)) == 2
+
+        pattern.score = 0.5
+        pattern.patterns = ["ORD-\\d{3}"]
+        results = manager.apply_patterns(text, entity_types=["ORDER_ID"])
+        assert [(r["text"], r["score"]) for r in results] == [("ORD-123", 0.5)]
+
+    def test_duplicate_regexes_scanned_once(self):
+        """A regex listed twice in one definition yields each match once."""
+        manager = PatternManager()
+        manager.add_pattern(CustomPatternDefinition(
+            entity_type="ORDER_ID", patterns=["ORD-\\d{6}", "ORD-\\d{6}"]
+        ))
+
+        assert len(manager.patterns[0].compiled_patterns) == 1
+        assert len(manager.apply_patterns("Order ORD-123456 shipped")) == 1
+
+    def test_compile_matches_apply_patterns(self):
+        """A compiled scanner returns what apply_patterns returns."""
+        manager = PatternManager()
+        manager.add_pattern(CustomPatternDefinition(entity_type="ORDER_ID", patterns=["ORD-(\\d{6})"]))
+        manager.add_pattern(CustomPatternDefinition(entity_type="INVOICE_ID", patterns=["INV-\\d{6}"]))
+        text = "Order ORD-123456, invoice INV-654321."
+
+        assert manager.compile()(text) == manager.apply_patterns(text)
+        scan = manager.compile(entity_types=["INVOICE_ID"])
+        assert scan(text) == manager.apply_patterns(text, entity_types=["INVOICE_ID"])
+        assert [r["text"] for r in manager.compile()(text)] == ["123456", "INV-654321"]
+
+    def test_apply_patterns_parallel_matches_apply_patterns(self):
+        """Chunked scans stitch back to the single-pass result, even across cuts."""
+        manager = PatternManager()
+        manager.add_pattern(CustomPatternDefinition(entity_type="ORDER_ID", patterns=["(?<=Order )ORD-(\\d{6})"]))
+        manager.add_pattern(CustomPatternDefinition(entity_type="INVOICE_ID", patterns=["\\bINV-\\d{6}\\b"]))
+        # Record lengths that don't divide the chunk size, so cuts land mid-match.
+        text = "".join(f"Order ORD-{i:06d}, invoice INV-{i:06d}; " for i in range(300))
+
+        expected = manager.apply_patterns(text)
+        assert len(expected) == 600
+        assert manager.apply_patterns_parallel(text, n_workers=2, min_chunk=500, overlap=64) == expected
+        assert manager.apply_patterns_parallel(text, n_workers=None) == expected
+
+    def test_required_literal_prefilter(self):
+        """Only literals that every match must contain are used to skip scans."""
+        assert required_literals(re.compile(r"\bPOL-\d+")) == ("POL-",)
+        assert required_literals(re.compile(r"abc?d")) == ("ab",)
+        assert required_literals(re.compile(r"(ab)*cd")) == ("cd",)
+        assert required_literals(re.compile(r"[A-Z]{3}\d{3}")) is None
+        assert required_literals(re.compile(r"a|bc")) == ("a", "bc")
+        assert required_literals(re.compile(r"a|\d")) is None
+        assert required_literals(re.compile(r"claim\d", re.IGNORECASE)) is None
+        # sre factors the shared "T" out; the alternatives keep it as a prefix.
+        assert required_literals(
+            re.compile(r"(?:TFN|Tax\s+File\s+Number):?\s*\d{9}")
+        ) == ("TFN", "Tax")
+
+        manager = PatternManager()
+        manager.add_pattern(
+            CustomPatternDefinition(entity_type="REF", patterns=[r"(?:REF|Ref No)\s*\d+"])
+        )
+        assert [r["text"] for r in manager.apply_patterns("Ref No 42")] == ["Ref No 42"]
+        assert manager.apply_patterns("no reference 42") == []
+
+        manager = PatternManager()
+        manager.add_pattern(CustomPatternDefinition(entity_type="CLAIM", patterns=["(?i)claim-\\d+"]))
+        results = manager.apply_patterns("See CLAIM-42.")
+        assert [r["text"] for r in results] == ["CLAIM-42"]
+
     def test_to_dict_list(self):
         """Test converting patterns to a list of dictionaries."""
         manager = PatternManager()
@@ -309,6 +418,69 @@ class TestPatternRegistry:
         assert len(self.registry.patterns["TEST_ENTITY"]) == 1
         assert self.registry.patterns["TEST_ENTITY"][0] == pattern
 
+    def test_register_pattern_ignores_duplicates(self):
+        """Registering the same definition twice keeps a single entry."""
+        pattern = CustomPatternDefinition(entity_type="TEST_ENTITY", patterns=["TEST-\\d{5}"])
+        twin = CustomPatternDefinition(entity_type="TEST_ENTITY", patterns=["TEST-\\d{5}"])
+
+        self.registry.register_pattern(pattern)
+        self.registry.register_pattern(pattern)
+        self.registry.register_pattern(twin)
+        assert self.registry.patterns["TEST_ENTITY"] == [pattern, twin]
+
+        self.registry.patterns["TEST_ENTITY"].remove(pattern)
+        self.registry.register_pattern(pattern)
+        assert self.registry.patterns["TEST_ENTITY"] == [twin, pattern]
+
+        # Same-length in-place replacement must not leave stale bookkeeping.
+        other = CustomPatternDefinition(entity_type="TEST_ENTITY", patterns=["OTHER-\\d{5}"])
+        self.registry.patterns["TEST_ENTITY"][1] = other
+        self.registry.register_pattern(other)
+        self.registry.register_pattern(pattern)
+        assert self.registry.patterns["TEST_ENTITY"] == [twin, other, pattern]
+
+        self.registry.patterns["TEST_ENTITY"][2] = twin
+        assert self.registry.register_many([twin, pattern]) == 2
+        assert self.registry.patterns["TEST_ENTITY"] == [twin, other, twin, pattern]
+
+        # Dropping one of two copies leaves the other registered.
+        del self.registry.patterns["TEST_ENTITY"][0]
+        self.registry.register_pattern(twin)
+        assert self.registry.patterns["TEST_ENTITY"] == [other, twin, pattern]
+
+        self.registry.patterns["TEST_ENTITY"][:] = [pattern]
+        self.registry.register_pattern(twin)
+        assert self.registry.patterns["TEST_ENTITY"] == [pattern, twin]
+
+        # A plain list assigned directly is picked up as well.
+        self.registry.patterns["TEST_ENTITY"] = [twin]
+        self.registry.register_pattern(twin)
+        self.registry.register_pattern(pattern)
+        assert self.registry.patterns["TEST_ENTITY"] == [twin, pattern]
+
+    def test_register_many_matches_register_pattern(self):
+        """register_many keeps the order and dedup of repeated register_pattern calls."""
+        a1 = CustomPatternDefinition(entity_type="ENTITY_A", patterns=["A-\\d{5}"])
+        b1 = CustomPatternDefinition(entity_type="ENTITY_B", patterns=["B-\\d{5}"])
+        a2 = CustomPatternDefinition(entity_type="ENTITY_A", patterns=["A2-\\d{5}"])
+        self.registry.register_pattern(a1)
+
+        assert self.registry.register_many([b1, a1, a2, b1]) == 4
+        assert list(self.registry.patterns) == ["ENTITY_A", "ENTITY_B"]
+        assert self.registry.patterns["ENTITY_A"] == [a1, a2]
+        assert self.registry.patterns["ENTITY_B"] == [b1]
+
+    def test_register_pattern_precompiles(self):
+        """Registered definitions are compiled once, sharing identical regexes."""
+        pattern = CustomPatternDefinition(entity_type="TEST_ENTITY", patterns=["TEST-\\d{5}"])
+        twin = CustomPatternDefinition(entity_type="OTHER_ENTITY", patterns=["TEST-\\d{5}"])
+
+        self.registry.register_pattern(pattern)
+        self.registry.register_pattern(twin)
+
+        assert pattern._compiled_snapshot == ("TEST-\\d{5}",)
+        assert pattern.compiled_patterns[0] is twin.compiled_patterns[0]
+
     def test_get_patterns(self):
         """Test getting patterns from the registry."""
         patterns = [
@@ -330,7 +502,12 @@ class TestPatternRegistry:
         assert entity_a_patterns[0].entity_type == "ENTITY_A"
         assert entity_a_patterns[1].entity_type == "ENTITY_A"
 
-    def test_save_load_patterns(self):
+        # iter_patterns yields the same definitions lazily
+        assert list(self.registry.iter_patterns()) == all_patterns
+        assert list(self.registry.iter_patterns("ENTITY_A")) == entity_a_patterns
+        assert list(self.registry.iter_patterns("MISSING")) == []
+
+    def test_save_load_patterns(self, tmp_path):
         """Test saving and loading patterns."""
         patterns = [
             CustomPatternDefinition(
@@ -349,7 +526,7 @@ class TestPatternRegistry:
             self.registry.register_pattern(pattern)
 
         # Save patterns
-        filepath = os.path.join(self.test_dir, "test_patterns.json")
+        filepath = str(tmp_path / "test_patterns.json")
         saved_path = self.registry.save_patterns(filepath)
 
         assert os.path.exists(saved_path)
@@ -362,6 +539,149 @@ class TestPatternRegistry:
         assert "ENTITY_A" in new_registry.patterns
         assert "ENTITY_B" in new_registry.patterns
 
+        # Compact (default) and pretty output hold the same data
+        pretty_path = self.registry.save_patterns(
+            str(tmp_path / "pretty.json"), pretty=True
+        )
+        with open(saved_path) as compact_file, open(pretty_path) as pretty_file:
+            assert json.load(compact_file) == json.load(pretty_file)
+
+        # Missing parent directories are created, existing ones reused
+        nested_path = str(tmp_path / "nested" / "dir" / "patterns.json")
+        for _ in range(2):
+            assert os.path.exists(self.registry.save_patterns(nested_path))
+
+        # An empty registry still writes a valid JSON list
+        empty_path = PatternRegistry().save_patterns(str(tmp_path / "empty.json"))
+        with open(empty_path) as file:
+            assert json.load(file) == []
+
+    def test_load_patterns_with_and_without_ijson(self, tmp_path, monkeypatch):
+        """Loading gives the same definitions via ijson and via json.load."""
+        from allyanonimiser.core import pattern_registry
+
+        self.registry.register_pattern(
+            CustomPatternDefinition(
+                entity_type="ENTITY_A", patterns=["A-\\d{5}"], score=0.9, name="Café Dürer"
+            )
+        )
+        filepath = self.registry.save_patterns(str(tmp_path / "patterns.json"))
+
+        for available in (True, False):
+            monkeypatch.setattr(pattern_registry, "IJSON_AVAILABLE",
+                                available and pattern_registry.IJSON_AVAILABLE)
+            new_registry = PatternRegistry()
+            assert new_registry.load_patterns(filepath) == 1
+            loaded = new_registry.get_patterns("ENTITY_A")[0]
+            assert loaded.patterns == ["A-\\d{5}"]
+            assert loaded.score == 0.9
+            assert loaded.name == "Café Dürer"
+            assert loaded.entity_type is sys.intern("ENTITY_A")
+
+    @pytest.mark.parametrize("use_ijson", [True, False], ids=["ijson", "json"])
+    def test_load_patterns_rejects_bad_files(self, tmp_path, monkeypatch, use_ijson):
+        """Malformed or non-array files fail the same way with or without ijson."""
+        from allyanonimiser.core import pattern_registry
+
+        if use_ijson:
+            pytest.importorskip("ijson")
+        monkeypatch.setattr(pattern_registry, "IJSON_AVAILABLE", use_ijson)
+
+        malformed = tmp_path / "malformed.json"
+        malformed.write_text('[{"entity_type": "ENTITY_A", "patterns": ["A"]}, {"entity')
+        registry = PatternRegistry()
+        with pytest.raises(json.JSONDecodeError):
+            registry.load_patterns(str(malformed))
+        assert registry.patterns == {}
+
+        not_array = tmp_path / "object.json"
+        not_array.write_text('{"entity_type": "ENTITY_A", "patterns": ["A"]}')
+        with pytest.raises(ValueError, match="JSON array"):
+            registry.load_patterns(str(not_array))
+        assert registry.patterns == {}
+
+    def test_load_patterns_streams_with_ijson(self, tmp_path, monkeypatch):
+        """With the streaming extra installed, pattern files are parsed by ijson."""
+        ijson = pytest.importorskip("ijson")
+        from allyanonimiser.core import pattern_registry
+
+        assert pattern_registry.IJSON_AVAILABLE
+        items = ijson.items
+        calls = []
+
+        def spy_items(*args, **kwargs):
+            calls.append(args[1:])
+            return items(*args, **kwargs)
+
+        monkeypatch.setattr(pattern_registry.ijson, "items", spy_items)
+
+        registry = PatternRegistry()
+        registry.register_many([
+            CustomPatternDefinition(entity_type="ENTITY_A", patterns=["A-\\d{5}"], score=0.9),
+            CustomPatternDefinition(entity_type="ENTITY_B", patterns=["B-\\d{5}"], name="Café"),
+        ])
+        for pretty in (False, True):
+            filepath = registry.save_patterns(str(tmp_path / f"patterns_{pretty}.json"), pretty=pretty)
+            loaded = PatternRegistry()
+            assert loaded.load_patterns(filepath) == 2
+            assert [p.to_dict() for p in loaded.iter_patterns()] == [
+                p.to_dict() for p in registry.iter_patterns()
+            ]
+            assert isinstance(loaded.get_patterns("ENTITY_A")[0].score, float)
+        assert calls == [("item",), ("item",)]
+
+    def test_pickle_cache(self, tmp_path):
+        """The pickle sidecar is used while the JSON file is unchanged since save."""
+        registry = PatternRegistry(pickle_cache=True)
+        registry.register_pattern(CustomPatternDefinition(entity_type="ENTITY_A", patterns=["A-\\d{5}"]))
+        filepath = registry.save_patterns(str(tmp_path / "patterns.json"))
+        cache_path = tmp_path / "patterns.json.patterns.pkl"
+        assert cache_path.exists()
+
+        # An unrelated patterns.pkl next to the file is never read
+        (tmp_path / "patterns.pkl").write_bytes(b"not a pickle")
+
+        # Make the cache distinguishable from the JSON file, keeping its stamp
+        with open(cache_path, "rb") as file:
+            stamp, _ = pickle.load(file)
+        with open(cache_path, "wb") as file:
+            pickle.dump((stamp, [{"entity_type": "FROM_CACHE", "patterns": ["C"]}]), file)
+
+        cached = PatternRegistry(pickle_cache=True)
+        assert cached.load_patterns(filepath) == 1
+        assert list(cached.patterns) == ["FROM_CACHE"]
+
+        # Without the flag, or once the JSON file changes, JSON wins, even
+        # when the sidecar's own mtime is newer
+        plain = PatternRegistry()
+        plain.load_patterns(filepath)
+        assert list(plain.patterns) == ["ENTITY_A"]
+
+        json_mtime = os.path.getmtime(filepath)
+        os.utime(cache_path, (json_mtime + 10, json_mtime + 10))
+        os.utime(filepath, (json_mtime + 1, json_mtime + 1))
+        stale = PatternRegistry(pickle_cache=True)
+        stale.load_patterns(filepath)
+        assert list(stale.patterns) == ["ENTITY_A"]
+
+    @pytest.mark.parametrize("payload", [
+        b"not a pickle",
+        pickle.dumps({"entity_type": "FROM_CACHE", "patterns": ["C"]}),
+        pickle.dumps([{"entity_type": "FROM_CACHE", "patterns": ["C"]}]),
+        pickle.dumps(((0, 0), ["FROM_CACHE"])),
+        b"\x80\x04cno_such_module\nThing\n.",
+    ], ids=["corrupt", "dict", "unstamped-list", "list-of-str", "missing-class"])
+    def test_bad_pickle_cache_falls_back_to_json(self, tmp_path, payload):
+        """An unreadable or wrong-shape sidecar is a cache miss, not an error."""
+        registry = PatternRegistry(pickle_cache=True)
+        registry.register_pattern(CustomPatternDefinition(entity_type="ENTITY_A", patterns=["A-\\d{5}"]))
+        filepath = registry.save_patterns(str(tmp_path / "patterns.json"))
+        (tmp_path / "patterns.json.patterns.pkl").write_bytes(payload)
+
+        loaded = PatternRegistry(pickle_cache=True)
+        assert loaded.load_patterns(filepath) == 1
+        assert list(loaded.patterns) == ["ENTITY_A"]
+
     def test_import_export_patterns(self):
         """Test importing and exporting patterns to/from a PatternManager."""
         # Create a manager with patterns
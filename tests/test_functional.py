@@ -7,6 +7,7 @@ work correctly when called with valid inputs.
 
 from allyanonimiser import (
     Allyanonimiser,
+    ClaimNotesAnalyzer,
     EnhancedAnalyzer,
     analyze_claim_notes,
     create_allyanonimiser,
@@ -63,3 +64,62 @@ def test_analyze_claim_notes():
     )
     assert isinstance(result, dict)
     assert "pii_segments" in result
+
+
+def test_claim_notes_analyzer_batch_matches_single():
+    """Batch claim-note analysis returns the same results as one-at-a-time."""
+    analyzer = ClaimNotesAnalyzer()
+    notes = [
+        "Insured John Smith, policy POL-123456, called from 0412 345 678.",
+        "Claim CL-987654 lodged; contact jane@example.com.",
+    ]
+    assert analyzer.analyze_batch(notes) == [analyzer.analyze(n) for n in notes]
+
+
+def test_analyze_claim_note_reuses_default_analyzer():
+    """analyze_claim_note builds its analyzer once per thread, not per call."""
+    from allyanonimiser.insurance import claim_notes_analyzer
+
+    claim_notes_analyzer.analyze_claim_note("Policy POL-123456 renewed.")
+    first = claim_notes_analyzer._get_default_analyzer()
+    result = claim_notes_analyzer.analyze_claim_note("Claim CL-987654 lodged.")
+    assert claim_notes_analyzer._get_default_analyzer() is first
+    assert "pii_entities" in result
+
+
+def test_claim_notes_analyze_batch_accepts_generator():
+    """A generator of notes gives the same results as the equivalent list."""
+    from allyanonimiser.insurance.claim_notes_analyzer import ClaimNotesAnalyzer
+
+    notes = ["Policy POL-123456 renewed.", "Contact jane@example.com."]
+    analyzer = ClaimNotesAnalyzer()
+    expected = analyzer.analyze_batch(notes)
+    assert len(expected) == 2
+    assert analyzer.analyze_batch(note for note in notes) == expected
+
+
+def test_analyze_claim_note_retains_no_text():
+    """The shared default analyzer must not cache claim-note text or PII."""
+    from allyanonimiser.insurance import claim_notes_analyzer
+
+    claim_notes_analyzer.analyze_claim_note("Contact jane@example.com re claim.")
+    claim_notes_analyzer.analyze_claim_notes_batch(["Claim CL-987654 lodged.", "Call 0412 345 678."])
+    analyzer = claim_notes_analyzer._get_default_analyzer().analyzer
+    stats = analyzer.get_cache_statistics()
+    assert stats["result_cache_size"] == 0
+    assert stats["pattern_cache_size"] == 0
+    assert stats["spacy_cache_size"] == 0
+
+
+def test_analyze_claim_notes_batch_process_pool():
+    """The process-pool path returns the same results, in order."""
+    from allyanonimiser import analyze_claim_note, analyze_claim_notes_batch
+
+    notes = [
+        "Policy POL-123456 renewed.",
+        "Claim CL-987654 lodged; contact jane@example.com.",
+        "Called insured on 0412 345 678.",
+    ] * 7  # enough notes that each worker chunk holds several
+    expected = [analyze_claim_note(n) for n in notes]
+    assert analyze_claim_notes_batch(notes) == expected
+    assert analyze_claim_notes_batch(notes, n_workers=2) == expected
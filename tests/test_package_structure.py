@@ -53,6 +53,34 @@ def test_pattern_imports():
     assert len(get_general_pattern_definitions()) > 0
 
 
+def test_pattern_definitions_are_independent_copies():
+    """Mutating returned definitions must not leak into later calls."""
+    from allyanonimiser.patterns import (
+        get_au_pattern_definitions,
+        get_general_intl_pattern_definitions,
+        get_general_pattern_definitions,
+        get_insurance_pattern_definitions,
+    )
+
+    for getter in (
+        get_au_pattern_definitions,
+        get_insurance_pattern_definitions,
+        get_general_pattern_definitions,
+        get_general_intl_pattern_definitions,
+    ):
+        first = getter()
+        first[0]["patterns"].append("EXTRA")
+        first[0]["context"].clear()
+
+        second = getter()
+        assert "EXTRA" not in second[0]["patterns"]
+        assert second[0]["context"]
+
+        entity_type = second[0]["entity_type"]
+        subset = getter(entity_types=[entity_type])
+        assert subset and {d["entity_type"] for d in subset} == {entity_type}
+
+
 def test_stream_processor_import():
     """Test that stream processor can be imported from the main package."""
     from allyanonimiser import POLARS_AVAILABLE
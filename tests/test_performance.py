@@ -1,13 +1,18 @@
 """
 Performance tests for DataFrame processing in Allyanonimiser.
 """
+import re
 import time
 
 import numpy as np
 import pandas as pd
 import pytest
 
-from allyanonimiser import create_allyanonimiser
+from allyanonimiser import (
+    create_allyanonimiser,
+    get_au_pattern_definitions,
+    get_general_pattern_definitions,
+)
 from allyanonimiser.io.dataframe_processor import DataFrameProcessor
 
 # Opt-in: run with `pytest -m performance tests/test_performance.py`.
@@ -201,6 +206,30 @@ def test_row_count_scaling(ally):
         rows_per_second = count / times[i]
         print(f"{count} rows: {rows_per_second:.1f} rows/second")
 
+
+@pytest.mark.parametrize("entity_type,text", [
+    ("AU_ADDRESS", "12 smith st " + "abcdefghij" * 2000),
+    ("AU_ADDRESS", "12 Smith Street " + "Abcdefghij" * 2000),
+    ("VEHICLE_REGISTRATION", "ABC " * 20000),
+    ("VEHICLE_REGISTRATION", "12 " * 20000),
+    ("ORGANIZATION", "Word " * 20000),
+    ("EMAIL_ADDRESS", "a." * 20000),
+])
+def test_regexes_do_not_backtrack_on_long_runs(entity_type, text):
+    """Long letter/word runs with no state, plate, company suffix or @
+    must fail fast. The old suburb group ``(?:[A-Za-z]+\\s*){1,3}`` could
+    split one long word O(n^2) ways; the plate lookahead, company-name
+    repeat and email local part scanned to the end of the run from
+    every start position."""
+    definition = next(
+        d for d in get_au_pattern_definitions() + get_general_pattern_definitions()
+        if d["entity_type"] == entity_type
+    )
+    start = time.perf_counter()
+    for pattern in definition["patterns"]:
+        list(re.finditer(pattern, text))
+    assert time.perf_counter() - start < 1.0
+
 if __name__ == "__main__":
     # Standalone execution: invoke fixtures by resolving their underlying function.
     df = large_df.__wrapped__()
@@ -120,6 +120,20 @@ def test_report_summary(sample_report):
     assert abs(summary["avg_processing_time"] - avg_time) < 0.001
 
 
+def test_entity_distribution_is_exact():
+    """Shares are count / total * 100, so a sole entity type is exactly 100.0."""
+    report = AnonymizationReport()
+    report.record_anonymization(
+        document_id="doc1",
+        original_text="Names",
+        anonymization_result={
+            "items": [{"entity_type": "PERSON", "original": "N"}] * 11
+        },
+        processing_time=0.1
+    )
+    assert report.get_summary()["entity_distribution"] == {"PERSON": 100.0}
+
+
 def test_detailed_report(sample_report):
     """Test generating a detailed report."""
     detailed = sample_report.get_detailed_report()
@@ -170,6 +184,12 @@ def test_export_report(sample_report, tmp_path):
         assert data["total_entities"] == 6
         assert data["entity_counts"]["PERSON"] == 3
 
+    # Compact JSON export carries the same data
+    compact_path = os.path.join(tmp_path, "report_compact.json")
+    sample_report.export_report(compact_path, format="json", pretty=False)
+    with open(compact_path) as f, open(json_path) as g:
+        assert json.load(f) == json.load(g)
+
     # Test CSV export
     csv_path = os.path.join(tmp_path, "report.csv")
     sample_report.export_report(csv_path, format="csv")
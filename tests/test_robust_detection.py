@@ -279,6 +279,18 @@ class TestRobustDetection:
                 f"{expected_type} missed in {text!r}. Found: {entity_types}"
             )
 
+    def test_email_local_part_is_matched_whole_or_not_at_all(self, analyzer):
+        """The 64-character local-part cap must never yield a tail-only
+        match that leaves the start of an over-long address unredacted."""
+        longest = "j" * 64 + "@example.com"
+        results = analyzer.analyze(f"Email {longest} today")
+        emails = [r.text for r in results if r.entity_type == "EMAIL_ADDRESS"]
+        assert emails == [longest]
+
+        too_long = "john.smith." + "x" * 59 + "@example.com"  # 70-char local part
+        results = analyzer.analyze(f"Email {too_long} today")
+        assert not [r for r in results if r.entity_type == "EMAIL_ADDRESS"]
+
     def test_incident_date_is_case_tolerant_and_specific(self, analyzer):
         """Incident-date labels are often lower or mixed case; keep their more
         specific entity type rather than falling back to generic DATE."""
@@ -85,6 +85,18 @@ class TestAnalyzeStateIsolation:
         ally.analyzer.set_active_entity_types(None)
         assert len(_entity_types(ally.analyze(SAMPLE_TEXT))) > 1
 
+    def test_filtered_call_does_not_poison_pattern_cache(self, ally):
+        """Inactive types are never scanned, so a filtered call's pattern
+        results must not be replayed for an unfiltered call on the same text."""
+        ally.analyze(SAMPLE_TEXT, active_entity_types=["EMAIL_ADDRESS"])
+        compiled = {
+            p.entity_type for p in ally.analyzer.patterns
+            if p._compiled_snapshot is not None
+        }
+        assert compiled == {"EMAIL_ADDRESS"}
+
+        assert "AU_TFN" in _entity_types(ally.analyze(SAMPLE_TEXT))
+
 
 class TestBatchSingleParity:
     """analyze_batch must produce identical results to per-text analyze()."""